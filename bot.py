@@ -8,14 +8,18 @@ Provides a remote control interface via Telegram to:
 """
 
 import os
+import functools
+import csv
+import queue
+import threading
 import time
 import asyncio
-from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from multiprocessing import Process, Queue, Value
 
 import ccxt
-import pandas as pd
+import numpy as np
+import requests
 from dotenv import load_dotenv
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
@@ -28,6 +32,11 @@ from telegram.ext import (
     filters,
 )
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the scan just runs uncompiled
+    njit = None
+
 from strategies.pump.latoken import LatokenPumpTrader
 from strategies.pump.poloniex import PoloniexPumpTrader
 from strategies.pump.mexc import MexcPumpTrader
@@ -35,16 +44,64 @@ from strategies.pump.digifinex import DigifinexPumpTrader
 from strategies.orderbook.poloniex import PoloniexOrderBookTrader
 from strategies.orderbook.latoken import LatokenOrderBookTrader
 from strategies.orderbook.digifinex import DigifinexOrderBookTrader
+from strategies.exchange import create_client, is_supported
 
 load_dotenv()
 
 # --- Conversation states ---
 USD, BENEFIT_PARTIAL, BENEFIT_TOTAL, TIME_LIMIT_PARTIAL, TIME_LIMIT_TOTAL, MIN_UP_START_TIME = range(6)
-THRESHOLD_QUOTE, DIF_TIME, THRESHOLD_PERCENTAGE, NAME_TRADER = range(4)
+THRESHOLD_QUOTE, DIF_TIME, THRESHOLD_PERCENTAGE, NAME_TRADER = range(6, 10)
+
+
+def _scan_ticks(idx, cur_price, cur_vol, min_price, min_vol,
+                out_idx, out_pct, thresh_pct, thresh_quote):
+    """Per-tick detection sweep over the structure-of-arrays state.
+
+    Updates the price/volume minima in place and writes the positions of
+    triggering rows into `out_idx` (and their percentages into `out_pct`),
+    returning the hit count. Compiled with Numba when available, so the
+    whole sweep runs in native code without NumPy temporaries; NaN is the
+    "not seen yet" sentinel throughout, keeping the signature float64.
+    """
+    hits = 0
+    for k in range(idx.shape[0]):
+        i = idx[k]
+        prev_min = min_price[i]
+        prev_vol = min_vol[i]
+        cp = cur_price[k]
+        cv = cur_vol[k]
+
+        percentage = np.nan
+        if np.isnan(prev_min) or prev_min == 0.0:
+            # 0.0 is as unusable a baseline as "not seen yet": dividing by
+            # it would crash under numba (or emit an inf percentage that
+            # fires a spurious alert), so re-seed the minimum instead.
+            min_price[i] = cp
+        elif not np.isnan(cp):
+            percentage = (cp - prev_min) / prev_min * 100
+            if cp < prev_min:
+                min_price[i] = cp
+
+        meets_price = not np.isnan(percentage) and percentage >= thresh_pct
+
+        if np.isnan(prev_vol):
+            min_vol[i] = cv
+        elif prev_vol == 0.0 or cv / prev_vol >= thresh_quote:
+            if cv >= 5.0 and meets_price:
+                out_idx[hits] = k
+                out_pct[hits] = percentage
+                hits += 1
+                min_vol[i] = cv
+    return hits
+
+
+if njit is not None:
+    _scan_ticks = njit(cache=True)(_scan_ticks)
+
 
 # --- VIP coin filter ---
 with open("data/coins.txt", "r") as f:
-    vip_filter = [line.strip() + "/USDT" for line in f]
+    vip_filter = frozenset(line.strip() + "/USDT" for line in f)
 
 filter_enabled = False
 
@@ -52,14 +109,17 @@ filter_enabled = False
 info = None
 trader = None
 name_trader = None
-alert_queue = Queue()
+usdt_symbols = ()
+alert_queue = queue.SimpleQueue()
 authorized_chat_id = int(os.getenv("TELEGRAM_ADMIN_ID", "0"))
-alert_process = None
-alert_job = None
+alert_thread = None
+alert_stop = threading.Event()
+alert_chat_id = None
+bot_event_loop = None
 buy_next = False
 buy_next_except = None
 time_buy_next = None
-pause_alerts = Value("b", False)
+pause_alerts = False
 bookorder_trader = None
 
 # --- Alert detection thresholds ---
@@ -82,9 +142,40 @@ time_strategy = 70
 time_limit_strategy = 210
 
 
+# Long-lived worker pool for trade execution. Forking a fresh process per
+# trade paid the interpreter/ccxt import cost on every buy; pool workers
+# are initialized once with a pre-warmed trader and reused.
+trade_executor = None
+_in_trade_worker = False
+
+
+def _init_trade_worker(trader_name: str) -> None:
+    """Pool initializer: pre-warm the trader objects inside the worker."""
+    global _in_trade_worker
+    _in_trade_worker = True
+    set_trader(trader_name)
+
+
+def _do_buy(symbol, usd, benefit_partial, benefit_total,
+            time_limit_partial, time_limit_total, min_up_start_time, slippage):
+    asyncio.run(trader.buy_and_sell(symbol, usd, benefit_partial, benefit_total,
+                                    time_limit_partial, time_limit_total,
+                                    min_up_start_time, slippage))
+
+
+def _do_strategy(symbol, usd, dif_activate, time_limit):
+    asyncio.run(bookorder_trader.strategy(symbol, usd, dif_activate, time_limit))
+
+
+def _log_trade_error(future) -> None:
+    exc = future.exception()
+    if exc is not None:
+        print(f"Trade task failed: {exc}")
+
+
 def set_trader(trader_name: str) -> None:
     """Initialize the exchange trader and info objects for the selected exchange."""
-    global info, trader, name_trader, bookorder_trader
+    global info, trader, name_trader, bookorder_trader, trade_executor, usdt_symbols
     name_trader = trader_name
 
     exchanges = {
@@ -97,9 +188,40 @@ def set_trader(trader_name: str) -> None:
     if trader_name in exchanges:
         exchange_cls, pump_cls, book_cls = exchanges[trader_name]
         info = exchange_cls()
+        info.enableRateLimit = False  # we pace our own request rate
+        info.options["warnOnFetchOpenOrdersWithoutSymbol"] = False
+
+        # Deep keep-alive connection pool: bursts of REST calls reuse
+        # established TCP+TLS sessions instead of re-handshaking. (The
+        # async trading clients get this from aiohttp's connector.)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=50, pool_block=False
+        )
+        info.session.mount("https://", adapter)
+        info.session.mount("http://", adapter)
+        info.session.headers["Connection"] = "keep-alive"
         trader = pump_cls()
         bookorder_trader = book_cls() if book_cls else None
 
+        # Load market metadata once here instead of lazily (and
+        # repeatedly validated) inside ccxt on first use, and cache the
+        # USDT universe for the alert scan.
+        try:
+            info.load_markets()
+            usdt_symbols = tuple(s for s in info.symbols if s[-5:] == "/USDT")
+        except Exception as e:
+            print(f"Error loading markets for {trader_name}: {e}")
+            usdt_symbols = ()
+
+        if not _in_trade_worker:
+            if trade_executor is not None:
+                trade_executor.shutdown(wait=False)
+            trade_executor = ProcessPoolExecutor(
+                max_workers=4,
+                initializer=_init_trade_worker,
+                initargs=(trader_name,),
+            )
+
 
 def save_order_book_to_csv(pair: str) -> None:
     """Record order book snapshots to CSV for later analysis."""
@@ -107,134 +229,223 @@ def save_order_book_to_csv(pair: str) -> None:
     filename = f"book_order/{pair[:-5]}.csv"
     time_start = time.time()
 
-    while time.time() - time_start < 200:
-        try:
-            order_book = info.fetch_order_book(pair)
-            bids = order_book["bids"][:5]
-            asks = order_book["asks"][:5]
-
-            row = {"timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-            for i, (price, volume) in enumerate(bids):
-                row[f"bid_price_{i + 1}"] = price
-                row[f"bid_vol_{i + 1}"] = volume
-            for i, (price, volume) in enumerate(asks):
-                row[f"ask_price_{i + 1}"] = price
-                row[f"ask_vol_{i + 1}"] = volume
-
-            df = pd.DataFrame([row])
-            header = not os.path.exists(filename)
-            df.to_csv(filename, mode="a", header=header, index=False)
-        except Exception as e:
-            print(f"Error collecting data: {e}")
+    # One file handle and one csv.writer for the whole run, instead of a
+    # fresh DataFrame and CSV writer per appended row.
+    write_header = not os.path.exists(filename)
+    with open(filename, "a", newline="", buffering=65536) as f:
+        writer = csv.writer(f)
+        if write_header:
+            header = ["timestamp"]
+            for i in range(1, 6):
+                header += [f"bid_price_{i}", f"bid_vol_{i}"]
+            for i in range(1, 6):
+                header += [f"ask_price_{i}", f"ask_vol_{i}"]
+            writer.writerow(header)
+
+        while time.time() - time_start < 200:
+            try:
+                order_book = info.fetch_order_book(pair, limit=5)
+
+                row = [datetime.now().strftime("%Y-%m-%d %H:%M:%S")]
+                for price, volume in order_book["bids"][:5]:
+                    row += [price, volume]
+                for price, volume in order_book["asks"][:5]:
+                    row += [price, volume]
+                writer.writerow(row)
+            except Exception as e:
+                print(f"Error collecting data: {e}")
 
-        time.sleep(1)
+            time.sleep(1)
+        f.flush()
 
 
-def alerts(alert_queue: Queue, pause_alerts) -> None:
-    """Continuously monitor tickers and push alerts when pump conditions are detected.
+def alerts(stop_event: threading.Event, exchange_names: tuple[str, ...]) -> None:
+    """Entry point for the alert monitoring thread.
 
-    Runs as a separate process. Checks for volume spikes and price increases
-    that exceed the configured thresholds.
+    The watcher is pure I/O plus a short native scan, so a daemon thread
+    sharing the bot's memory replaces the old child process: no pickling,
+    no shared-memory blocks, no fork. It runs the WebSocket watch loops
+    inside its own event loop.
     """
-    min_quote_volume: dict[str, float] = {}
-    min_price: dict[str, float] = {}
+    if not exchange_names:
+        print("Alert error: no trader configured")
+        return
+    asyncio.run(_watch_alerts(stop_event, exchange_names))
 
-    while True:
+
+async def _watch_alerts(stop_event: threading.Event,
+                        exchange_names: tuple[str, ...]) -> None:
+    """Fan one ticker watcher out per exchange and aggregate their alerts.
+
+    Watching the exchanges as concurrent tasks on one event loop means
+    total detection latency is the slowest single feed instead of the
+    sum of all of them.
+    """
+    await asyncio.gather(
+        *(_watch_exchange(name, stop_event) for name in exchange_names)
+    )
+
+
+async def _watch_exchange(exchange_name: str, stop_event: threading.Event) -> None:
+    """Stream one exchange's tickers and push alerts on pump conditions.
+
+    Uses ccxt.pro's `watch_tickers` so ticker updates arrive push-style
+    instead of polling the full REST ticker map every 200 ms. Only the
+    symbols present in each delta are scanned. Falls back to REST polling
+    on exchanges without a ticker stream.
+    """
+    # Exchanges missing from ccxt.pro (latoken, digifinex) get the plain
+    # async client and take the REST polling branch below.
+    exchange = create_client(exchange_name)
+    use_websocket = exchange.has.get("watchTickers")
+
+    # The symbol universe is static for the lifetime of the watcher. For
+    # the trading exchange it was cached by set_trader; secondary
+    # exchanges load their own market list once.
+    if exchange_name == name_trader and usdt_symbols:
+        symbols = usdt_symbols
+    else:
+        while not stop_event.is_set():
+            try:
+                await exchange.load_markets()
+                break
+            except Exception as e:
+                print(f"Alert error: {e}")
+                await asyncio.sleep(1)
+        symbols = tuple(s for s in exchange.symbols if s[-5:] == "/USDT")
+
+    # The full USDT universe stays in the arrays; the VIP filter is
+    # applied per emitted alert instead, so toggling /filter takes
+    # effect immediately (the watcher thread reads the live flag).
+    watched_symbols = sorted(symbols)
+    symbol_to_idx = {s: i for i, s in enumerate(watched_symbols)}
+
+    # Structure-of-arrays state: one float64 slot per watched symbol, with
+    # NaN marking "not seen yet" so the whole scan stays in NumPy instead
+    # of per-symbol dict lookups and branches.
+    min_price = np.full(len(watched_symbols), np.nan)
+    min_quote_volume = np.full(len(watched_symbols), np.nan)
+
+    while not stop_event.is_set():
         try:
-            if pause_alerts.value:
-                time.sleep(2.5)
+            if pause_alerts:
+                await asyncio.sleep(2.5)
+
+            if use_websocket:
+                tickers = await exchange.watch_tickers()
+            else:
+                tickers = await exchange.fetch_tickers()
 
-            tickers = info.fetch_tickers()
+            # Gather the delta into compact arrays.
+            idx_list, price_list, vol_list = [], [], []
             for symbol, value in tickers.items():
-                if not symbol.endswith("USDT"):
+                i = symbol_to_idx.get(symbol)
+                if i is None:
                     continue
-                if filter_enabled and symbol not in vip_filter:
-                    continue
-
                 quote_volume = value["quoteVolume"]
                 if quote_volume is None:
                     continue
-
-                # Track price changes
-                percentage = None
                 current_price = value["last"]
-
-                if symbol in min_price:
-                    prev_min = min_price[symbol]
-                    if current_price is not None and prev_min is not None:
-                        percentage = round((current_price - prev_min) / prev_min * 100, 2)
-                    if prev_min is None or (current_price is not None and current_price < prev_min):
-                        min_price[symbol] = current_price
-                else:
-                    min_price[symbol] = current_price
-
-                meets_price_threshold = percentage is not None and percentage >= threshold_percentage
-
-                # Track volume changes and trigger alerts
-                if symbol in min_quote_volume:
-                    prev_volume = min_quote_volume[symbol]
-                    if prev_volume == 0:
-                        if quote_volume >= 5 and meets_price_threshold:
-                            alert_queue.put({
-                                "crypto": symbol,
-                                "vol_act": quote_volume,
-                                "vol_ant": prev_volume,
-                                "percentage": percentage,
-                            })
-                            min_quote_volume[symbol] = quote_volume
-                    elif quote_volume / prev_volume >= threshold_quote:
-                        if quote_volume >= 5 and meets_price_threshold:
-                            alert_queue.put({
-                                "crypto": symbol,
-                                "vol_act": quote_volume,
-                                "vol_ant": prev_volume,
-                                "percentage": percentage,
-                            })
-                            min_quote_volume[symbol] = quote_volume
-                else:
-                    min_quote_volume[symbol] = quote_volume
-
-            time.sleep(0.2)
+                idx_list.append(i)
+                price_list.append(np.nan if current_price is None else current_price)
+                vol_list.append(quote_volume)
+
+            if not idx_list:
+                if not use_websocket:
+                    await asyncio.sleep(0.2)
+                continue
+
+            idx = np.array(idx_list, dtype=np.intp)
+            cur_price = np.array(price_list)
+            cur_vol = np.array(vol_list)
+            prev_vol = min_quote_volume[idx]
+            out_idx = np.empty(len(idx), dtype=np.intp)
+            out_pct = np.empty(len(idx))
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                hits = _scan_ticks(
+                    idx, cur_price, cur_vol,
+                    min_price, min_quote_volume,
+                    out_idx, out_pct,
+                    float(threshold_percentage), float(threshold_quote),
+                )
+
+            emitted = 0
+            for j in range(hits):
+                k = out_idx[j]
+                symbol = watched_symbols[idx[k]]
+                if filter_enabled and symbol not in vip_filter:
+                    continue
+                alert_queue.put({
+                    "crypto": symbol,
+                    "exchange": exchange_name,
+                    "vol_act": cur_vol[k],
+                    "vol_ant": prev_vol[k],
+                    "percentage": out_pct[j],
+                })
+                emitted += 1
+            if emitted and bot_event_loop is not None:
+                bot_event_loop.call_soon_threadsafe(_wake_alert_sender)
+
+            if not use_websocket:
+                await asyncio.sleep(0.2)
         except Exception as e:
             print(f"Alert error: {e}")
-            time.sleep(1)
+            await asyncio.sleep(1)
+
+    await exchange.close()
 
 
 async def start_strategy(symbol: str) -> None:
     """Launch the order book strategy after a delay."""
     await asyncio.sleep(time_strategy)
-    strategy_process = Process(
-        target=bookorder_trader.strategy,
-        args=(symbol, 4, 30, time_limit_strategy),
+    future = trade_executor.submit(
+        _do_strategy, symbol, 4, 30, time_limit_strategy
     )
-    strategy_process.start()
+    future.add_done_callback(_log_trade_error)
 
 
 async def buy_crypto(crypto_name: str) -> None:
     """Execute a buy trade for the given crypto pair."""
+    global pause_alerts
     print(f"Buying {crypto_name}")
     symbol = crypto_name[:-5]
-    pause_alerts.value = True
+    pause_alerts = True
 
-    buy_process = Process(
-        target=trader.buy_and_sell,
-        args=(symbol, usd, benefit_partial, benefit_total,
-              time_limit_partial, time_limit_total, min_up_start_time, slippage),
+    future = trade_executor.submit(
+        _do_buy, symbol, usd, benefit_partial, benefit_total,
+        time_limit_partial, time_limit_total, min_up_start_time, slippage,
     )
-    buy_process.start()
+    future.add_done_callback(_log_trade_error)
     await asyncio.sleep(2)
 
-    pause_alerts.value = False
+    pause_alerts = False
     if do_strategy:
         asyncio.create_task(start_strategy(symbol))
 
 
 # --- Telegram command handlers ---
 
+def authorized(handler):
+    """Reject commands from any chat but the configured admin chat.
+
+    Applied to every command handler so the check runs once, before any
+    work, instead of being repeated (or forgotten) in handler bodies.
+    """
+    @functools.wraps(handler)
+    async def wrapper(update: Update, context: CallbackContext):
+        if update.message.chat_id != authorized_chat_id:
+            await update.message.reply_text("Unauthorized.")
+            return
+        return await handler(update, context)
+    return wrapper
+
+
+@authorized
 async def help_command(update: Update, context: CallbackContext) -> None:
     """Show available commands."""
     commands = (
-        "/startalerts - Start automatic alerts\n"
+        "/startalerts [exchanges...] - Start automatic alerts\n"
         "/stopalerts - Stop automatic alerts\n"
         "/benefitsettings - Configure profit parameters\n"
         "/datasettings - Configure detection parameters\n"
@@ -252,6 +463,7 @@ async def help_command(update: Update, context: CallbackContext) -> None:
     await update.message.reply_text(f"Available commands:\n{commands}")
 
 
+@authorized
 async def toggle_filter(update: Update, context: CallbackContext) -> None:
     """Toggle the VIP coin filter on/off."""
     global filter_enabled
@@ -260,89 +472,92 @@ async def toggle_filter(update: Update, context: CallbackContext) -> None:
     await update.message.reply_text(f"VIP coin filter {status}.")
 
 
-# --- Benefit settings conversation ---
-
+# --- Settings conversations ---
+#
+# Both conversations are the same shape: parse the reply, store it, ask
+# for the next field. One dispatch table and one generic step handler
+# replace the ten near-identical handlers that used to encode this.
+
+def _set_global(name, cast):
+    """Return a setter storing cast(text) into the module global `name`."""
+    def setter(text: str) -> None:
+        globals()[name] = cast(text)
+    return setter
+
+
+# state -> (setter, prompt for the next field, next state)
+SETTINGS_STEPS = {
+    USD: (_set_global("usd", float),
+          "Enter Benefit Partial:", BENEFIT_PARTIAL),
+    BENEFIT_PARTIAL: (_set_global("benefit_partial", float),
+                      "Enter Benefit Total:", BENEFIT_TOTAL),
+    BENEFIT_TOTAL: (_set_global("benefit_total", float),
+                    "Enter Time Limit Partial (seconds):", TIME_LIMIT_PARTIAL),
+    TIME_LIMIT_PARTIAL: (_set_global("time_limit_partial", float),
+                         "Enter Time Limit Total (seconds):", TIME_LIMIT_TOTAL),
+    TIME_LIMIT_TOTAL: (_set_global("time_limit_total", float),
+                       "Enter Min Up Start Time:", MIN_UP_START_TIME),
+    MIN_UP_START_TIME: (_set_global("min_up_start_time", float),
+                        None, ConversationHandler.END),
+    THRESHOLD_QUOTE: (_set_global("threshold_quote", float),
+                      "Enter Dif Time (minutes):", DIF_TIME),
+    DIF_TIME: (_set_global("dif_time", lambda text: int(text) * 60),
+               "Enter Threshold Percentage:", THRESHOLD_PERCENTAGE),
+    THRESHOLD_PERCENTAGE: (_set_global("threshold_percentage", float),
+                           "Enter trader name (latoken, poloniex, mexc, digifinex):",
+                           NAME_TRADER),
+    NAME_TRADER: (set_trader, None, ConversationHandler.END),
+}
+
+
+@authorized
 async def parameters(update: Update, context: CallbackContext) -> int:
+    context.user_data["settings_state"] = USD
     await update.message.reply_text("Enter USD amount:")
     return USD
 
-async def set_usd(update: Update, context: CallbackContext) -> int:
-    global usd
-    usd = float(update.message.text)
-    await update.message.reply_text("Enter Benefit Partial:")
-    return BENEFIT_PARTIAL
-
-async def set_benefit_partial(update: Update, context: CallbackContext) -> int:
-    global benefit_partial
-    benefit_partial = float(update.message.text)
-    await update.message.reply_text("Enter Benefit Total:")
-    return BENEFIT_TOTAL
-
-async def set_benefit_total(update: Update, context: CallbackContext) -> int:
-    global benefit_total
-    benefit_total = float(update.message.text)
-    await update.message.reply_text("Enter Time Limit Partial (seconds):")
-    return TIME_LIMIT_PARTIAL
-
-async def set_time_limit_partial(update: Update, context: CallbackContext) -> int:
-    global time_limit_partial
-    time_limit_partial = float(update.message.text)
-    await update.message.reply_text("Enter Time Limit Total (seconds):")
-    return TIME_LIMIT_TOTAL
-
-async def set_time_limit_total(update: Update, context: CallbackContext) -> int:
-    global time_limit_total
-    time_limit_total = float(update.message.text)
-    await update.message.reply_text("Enter Min Up Start Time:")
-    return MIN_UP_START_TIME
-
-async def set_min_up_start_time(update: Update, context: CallbackContext) -> int:
-    global min_up_start_time
-    min_up_start_time = float(update.message.text)
-    await update.message.reply_text(
-        f"Parameters set: USD={usd}, Partial={benefit_partial}, "
-        f"Total={benefit_total}, TLP={time_limit_partial}, "
-        f"TLT={time_limit_total}, MinUp={min_up_start_time}"
-    )
-    return ConversationHandler.END
-
-
-# --- Data settings conversation ---
 
+@authorized
 async def parameters_threshold(update: Update, context: CallbackContext) -> int:
+    context.user_data["settings_state"] = THRESHOLD_QUOTE
     await update.message.reply_text("Enter Threshold Quote:")
     return THRESHOLD_QUOTE
 
-async def set_threshold_quote(update: Update, context: CallbackContext) -> int:
-    global threshold_quote
-    threshold_quote = float(update.message.text)
-    await update.message.reply_text("Enter Dif Time (minutes):")
-    return DIF_TIME
-
-async def set_dif_time(update: Update, context: CallbackContext) -> int:
-    global dif_time
-    dif_time = int(update.message.text) * 60
-    await update.message.reply_text("Enter Threshold Percentage:")
-    return THRESHOLD_PERCENTAGE
-
-async def set_threshold_percentage(update: Update, context: CallbackContext) -> int:
-    global threshold_percentage
-    threshold_percentage = float(update.message.text)
-    await update.message.reply_text("Enter trader name (latoken, poloniex, mexc, digifinex):")
-    return NAME_TRADER
-
-async def set_name_trader(update: Update, context: CallbackContext) -> int:
-    name = update.message.text
-    set_trader(name)
-    await update.message.reply_text(
-        f"Parameters set: Quote={threshold_quote}, DifTime={dif_time}s, "
-        f"Percentage={threshold_percentage}%, Trader={name}"
-    )
+
+async def settings_step(update: Update, context: CallbackContext) -> int:
+    """Generic conversation step driven by SETTINGS_STEPS."""
+    state = context.user_data["settings_state"]
+    setter, next_prompt, next_state = SETTINGS_STEPS[state]
+
+    try:
+        setter(update.message.text)
+    except ValueError:
+        await update.message.reply_text("Invalid value, try again:")
+        return state
+
+    if next_prompt is not None:
+        context.user_data["settings_state"] = next_state
+        await update.message.reply_text(next_prompt)
+        return next_state
+
+    del context.user_data["settings_state"]
+    if state == MIN_UP_START_TIME:
+        await update.message.reply_text(
+            f"Parameters set: USD={usd}, Partial={benefit_partial}, "
+            f"Total={benefit_total}, TLP={time_limit_partial}, "
+            f"TLT={time_limit_total}, MinUp={min_up_start_time}"
+        )
+    else:
+        await update.message.reply_text(
+            f"Parameters set: Quote={threshold_quote}, DifTime={dif_time}s, "
+            f"Percentage={threshold_percentage}%, Trader={name_trader}"
+        )
     return ConversationHandler.END
 
 
 # --- Utility commands ---
 
+@authorized
 async def show_settings(update: Update, context: CallbackContext) -> None:
     """Display all current configuration parameters."""
     settings = (
@@ -366,6 +581,7 @@ async def show_settings(update: Update, context: CallbackContext) -> None:
     await update.message.reply_text(settings)
 
 
+@authorized
 async def set_slippage_cmd(update: Update, context: CallbackContext) -> None:
     global slippage
     args = context.args
@@ -376,6 +592,7 @@ async def set_slippage_cmd(update: Update, context: CallbackContext) -> None:
     await update.message.reply_text(f"Slippage set to {slippage}")
 
 
+@authorized
 async def set_time_limit_strategy_cmd(update: Update, context: CallbackContext) -> None:
     global time_limit_strategy
     args = context.args
@@ -386,6 +603,29 @@ async def set_time_limit_strategy_cmd(update: Update, context: CallbackContext)
     await update.message.reply_text(f"Strategy time limit set to {time_limit_strategy}s")
 
 
+def _tail_lines(path: str, lines: int, chunk_size: int = 65536) -> str:
+    """Return the last `lines` lines of a file, seeking backwards from EOF.
+
+    Reads fixed-size chunks from the end until enough newlines are seen,
+    so I/O is proportional to the requested tail rather than the full
+    log size.
+    """
+    if lines <= 0:
+        return ""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= lines:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    tail = data.splitlines()[-lines:]
+    return b"\n".join(tail).decode(errors="replace")
+
+
+@authorized
 async def showlog(update: Update, context: CallbackContext) -> None:
     """Show the last N lines from the log file."""
     args = context.args
@@ -394,8 +634,7 @@ async def showlog(update: Update, context: CallbackContext) -> None:
         return
     lines = int(args[0])
     try:
-        with open("log.out", "r") as file:
-            log = "".join(deque(file, maxlen=lines))
+        log = _tail_lines("log.out", lines)
         if not log:
             await update.message.reply_text("No logs found.")
         else:
@@ -421,46 +660,81 @@ async def button_callback(update: Update, context: CallbackContext) -> None:
         await query.edit_message_text(f"Buy error: {e}")
 
 
-async def send_alerts(context: CallbackContext) -> None:
-    """Process alert queue and send Telegram notifications with buy buttons."""
-    global buy_next, buy_next_except, time_buy_next
-    job = context.job
-    chat_id = job.data
+def _wake_alert_sender() -> None:
+    """Scheduled onto the bot loop by the alert thread after each enqueue."""
+    application.create_task(send_alerts())
 
-    while not alert_queue.empty():
-        alert = alert_queue.get()
-        crypto = alert["crypto"]
 
-        # Auto-buy logic
-        if buy_next and (buy_next_except is None or buy_next_except != crypto):
-            buy_next = False
-            buy_next_except = None
-            await buy_crypto(crypto)
-        elif (time_buy_next is not None
-              and time.time() >= time_buy_next
-              and time.time() < (time_buy_next + 300)):
-            time_buy_next = None
-            await buy_crypto(crypto)
+async def send_alerts() -> None:
+    """Drain the alert queue and send one coalesced Telegram notification.
 
-        vol_act = round(alert["vol_act"], 4)
-        vol_ant = round(alert["vol_ant"], 4)
-        percentage = alert["percentage"]
+    All pending alerts are pulled in a single batch and sent as one
+    message (one line and one buy button per crypto), so N alerts cost
+    one Telegram round-trip instead of N. Runs only when the alert
+    thread schedules a wakeup; the bot burns no CPU while idle.
+    """
+    global buy_next, buy_next_except, time_buy_next
+    chat_id = alert_chat_id
+    if chat_id is None:
+        return
 
-        buttons = [[InlineKeyboardButton("Buy", callback_data=crypto)]]
-        reply_markup = InlineKeyboardMarkup(buttons)
+    batch = []
+    try:
+        while True:
+            batch.append(alert_queue.get_nowait())
+    except queue.Empty:
+        pass
+    if not batch:
+        return
 
-        await context.bot.send_message(
+    bought = False
+    entries = []
+    for alert in batch:
+        crypto = alert["crypto"]
+        exchange_name = alert["exchange"]
+        # Only alerts from the trading exchange are actionable; the rest
+        # are informational.
+        tradable = exchange_name == name_trader
+
+        # Auto-buy logic (at most one buy per batch)
+        if tradable and not bought:
+            if buy_next and (buy_next_except is None or buy_next_except != crypto):
+                buy_next = False
+                buy_next_except = None
+                await buy_crypto(crypto)
+                bought = True
+            elif (time_buy_next is not None
+                  and time.time() >= time_buy_next
+                  and time.time() < (time_buy_next + 300)):
+                time_buy_next = None
+                await buy_crypto(crypto)
+                bought = True
+
+        line = (
+            f"Crypto: {crypto} ({exchange_name}) | "
+            f"Volume: {alert['vol_ant']:.4f} -> {alert['vol_act']:.4f} | "
+            f"Change: {alert['percentage']:.2f}%"
+        )
+        button = (
+            [InlineKeyboardButton(f"Buy {crypto}", callback_data=crypto)]
+            if tradable else None
+        )
+        entries.append((line, button))
+
+    # Telegram caps messages at 4096 chars and markups at 100 buttons,
+    # so very large batches are split into chunks.
+    chunk_size = 30
+    for i in range(0, len(entries), chunk_size):
+        part = entries[i:i + chunk_size]
+        buttons = [button for _, button in part if button is not None]
+        await application.bot.send_message(
             chat_id=chat_id,
-            text=(
-                f"Crypto: {crypto}\n"
-                f"Volume Now: {vol_act}\n"
-                f"Volume Before: {vol_ant}\n"
-                f"Change: {percentage}%"
-            ),
-            reply_markup=reply_markup,
+            text="\n".join(line for line, _ in part),
+            reply_markup=InlineKeyboardMarkup(buttons) if buttons else None,
         )
 
 
+@authorized
 async def toggle_strategy(update: Update, context: CallbackContext) -> None:
     """Toggle the order book strategy on/off."""
     global do_strategy, time_strategy
@@ -474,6 +748,7 @@ async def toggle_strategy(update: Update, context: CallbackContext) -> None:
         await update.message.reply_text("Strategy disabled.")
 
 
+@authorized
 async def toggle_buynext(update: Update, context: CallbackContext) -> None:
     """Toggle auto-buy on next alert."""
     global buy_next, buy_next_except
@@ -490,6 +765,7 @@ async def toggle_buynext(update: Update, context: CallbackContext) -> None:
         await update.message.reply_text("Auto-buy disabled.")
 
 
+@authorized
 async def timer_buynext(update: Update, context: CallbackContext) -> None:
     """Set a timestamp for timed auto-buy."""
     global time_buy_next
@@ -502,12 +778,9 @@ async def timer_buynext(update: Update, context: CallbackContext) -> None:
     await update.message.reply_text(f"Auto-buy scheduled at:\n{formatted}")
 
 
+@authorized
 async def manual_buy(update: Update, context: CallbackContext) -> None:
     """Execute a manual buy for a specific crypto."""
-    chat_id = update.message.chat_id
-    if chat_id != authorized_chat_id:
-        await update.message.reply_text("Unauthorized.")
-        return
     args = context.args
     if len(args) != 1:
         await update.message.reply_text("Usage: /buy <symbol>")
@@ -520,12 +793,9 @@ async def manual_buy(update: Update, context: CallbackContext) -> None:
         await update.message.reply_text(f"Buy error: {e}")
 
 
+@authorized
 async def manual_strategy_buy(update: Update, context: CallbackContext) -> None:
     """Execute a manual order book strategy buy."""
-    chat_id = update.message.chat_id
-    if chat_id != authorized_chat_id:
-        await update.message.reply_text("Unauthorized.")
-        return
     args = context.args
     if len(args) != 1:
         await update.message.reply_text("Usage: /buystrategy <symbol>")
@@ -537,62 +807,78 @@ async def manual_strategy_buy(update: Update, context: CallbackContext) -> None:
         await update.message.reply_text(f"Strategy error: {e}")
 
 
+@authorized
 async def stop_alerts(update: Update, context: CallbackContext) -> None:
     """Stop the alert monitoring system."""
-    global alert_job, alert_process
+    global alert_chat_id, alert_thread
     active = True
 
-    if alert_job:
-        alert_job.schedule_removal()
-        alert_job = None
+    if alert_chat_id is not None:
+        alert_chat_id = None
     else:
         active = False
-        await update.message.reply_text("Alert job not running.")
+        await update.message.reply_text("Alert listener not running.")
 
-    if alert_process:
-        alert_process.kill()
-        alert_process.join()
-        alert_process = None
+    if alert_thread:
+        alert_stop.set()
+        alert_thread = None
     else:
         active = False
-        await update.message.reply_text("Alert process not running.")
+        await update.message.reply_text("Alert thread not running.")
 
     if active:
         await update.message.reply_text("Alerts stopped.")
 
 
-def start_alerts() -> None:
-    """Launch the alert monitoring process."""
-    global alert_process
-    alert_process = Process(target=alerts, args=(alert_queue, pause_alerts))
-    alert_process.start()
+def start_alerts(exchange_names: tuple[str, ...]) -> None:
+    """Launch the alert monitoring thread.
+
+    Each launch gets its own stop event so a stopped watcher that has
+    not yet observed its flag can never be resurrected by a restart.
+    """
+    global alert_thread, alert_stop
+    alert_stop = threading.Event()
+    alert_thread = threading.Thread(
+        target=alerts, args=(alert_stop, exchange_names), daemon=True
+    )
+    alert_thread.start()
 
 
+@authorized
 async def alerts_command(update: Update, context: CallbackContext) -> None:
     """Start alert monitoring (authorized users only)."""
-    global alert_job
+    global alert_chat_id, bot_event_loop
     chat_id = update.message.chat_id
-    if chat_id != authorized_chat_id:
-        await update.message.reply_text("Unauthorized.")
+
+    # Extra exchange names fan monitoring out beyond the trading
+    # exchange, e.g. /startalerts mexc digifinex.
+    names = [n.lower() for n in context.args] if context.args else []
+    if name_trader is not None and name_trader not in names:
+        names.insert(0, name_trader)
+    if not names:
+        await update.message.reply_text("No trader configured; run /datasettings first.")
+        return
+    unknown = [n for n in names if not is_supported(n)]
+    if unknown:
+        await update.message.reply_text(f"Unknown exchange(s): {', '.join(unknown)}")
         return
-    start_alerts()
-    alert_job = context.job_queue.run_repeating(
-        send_alerts, interval=0.2, first=0, data=chat_id
-    )
-    await update.message.reply_text("Alerts started.")
+
+    bot_event_loop = asyncio.get_running_loop()
+    start_alerts(tuple(names))
+    alert_chat_id = chat_id
+    await update.message.reply_text(f"Alerts started ({', '.join(names)}).")
 
 
 # --- Conversation handlers ---
 
+_SETTINGS_STEP_HANDLER = MessageHandler(filters.TEXT & ~filters.COMMAND, settings_step)
+
 conv_handler = ConversationHandler(
     entry_points=[CommandHandler("benefitsettings", parameters)],
     states={
-        USD: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_usd)],
-        BENEFIT_PARTIAL: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_benefit_partial)],
-        BENEFIT_TOTAL: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_benefit_total)],
-        TIME_LIMIT_PARTIAL: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_time_limit_partial)],
-        TIME_LIMIT_TOTAL: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_time_limit_total)],
-        MIN_UP_START_TIME: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_min_up_start_time)],
+        state: [_SETTINGS_STEP_HANDLER]
+        for state in (USD, BENEFIT_PARTIAL, BENEFIT_TOTAL,
+                      TIME_LIMIT_PARTIAL, TIME_LIMIT_TOTAL, MIN_UP_START_TIME)
     },
     fallbacks=[],
 )
@@ -600,10 +886,8 @@ conv_handler = ConversationHandler(
 conv_handler_threshold = ConversationHandler(
     entry_points=[CommandHandler("datasettings", parameters_threshold)],
     states={
-        THRESHOLD_QUOTE: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_threshold_quote)],
-        DIF_TIME: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_dif_time)],
-        THRESHOLD_PERCENTAGE: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_threshold_percentage)],
-        NAME_TRADER: [MessageHandler(filters.TEXT & ~filters.COMMAND, set_name_trader)],
+        state: [_SETTINGS_STEP_HANDLER]
+        for state in (THRESHOLD_QUOTE, DIF_TIME, THRESHOLD_PERCENTAGE, NAME_TRADER)
     },
     fallbacks=[],
 )
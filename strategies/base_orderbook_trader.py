@@ -9,60 +9,106 @@ high-volatility events (pumps/dumps). It continuously:
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+import random
 import time
-import math
 import ccxt
+import ccxt.async_support
+
+from strategies.book import book_top
+from strategies.log import get_logger
+from strategies.ratelimit import RateLimiter
+
+logger = get_logger(__name__)
+
+# Action codes for a live order, resolved from a branchlessly-computed
+# state mask (bit 0: filled, bit 1: displaced from the top, bit 2: level
+# gap too wide). The table encodes the branch priority - filled wins,
+# then displacement, then the gap re-place toward the second level.
+_ACT_NONE, _ACT_FILLED, _ACT_DISPLACED, _ACT_DISPLACED_SECOND = range(4)
+_ORDER_ACTIONS = tuple(
+    _ACT_FILLED if state & 1
+    else _ACT_DISPLACED if state & 2
+    else _ACT_DISPLACED_SECOND if state & 4
+    else _ACT_NONE
+    for state in range(8)
+)
 
 
 class BaseOrderBookTrader(ABC):
     """Abstract base for exchange-specific order book traders.
 
-    Subclasses only need to implement `_create_exchange()` to provide
-    a configured ccxt exchange instance. All trading logic is shared.
+    Subclasses only need to implement `_create_exchange()` to provide a
+    configured async ccxt exchange instance. All trading logic is shared.
+
+    The strategy loop is a coroutine driven by one event loop per run
+    (`asyncio.run` in the worker process); order book updates arrive over
+    WebSocket where the exchange supports it, so each decision reacts to
+    a pushed delta instead of a polled REST snapshot.
     """
 
+    # Cloudflare edge (IATA code) the exchange's API is fastest from;
+    # subclasses set it where known so deployments can be placed there.
+    PREFERRED_REGION: str | None = None
+
+    # Order book depth to request. The loops only read the top two
+    # levels, so shrinking the payload 10-100x cuts transfer and parse
+    # cost; subclasses can override for exchanges that want a specific
+    # depth (or None to take the exchange default).
+    OB_DEPTH: int | None = 5
+
     def __init__(self) -> None:
-        self.exchange: ccxt.Exchange = self._create_exchange()
-        self._load_markets()
-        self._warmup_connection()
+        self.exchange: ccxt.async_support.Exchange = self._create_exchange()
+        # One bucket paced from the exchange's declared request interval,
+        # shared by every REST helper on this client.
+        self._rate_limiter = RateLimiter(1000.0 / max(self.exchange.rateLimit or 0, 1))
+        self._colo_checked = False
+        # Local free-balance ledger: updated from our own placements and
+        # fills so the hot loop never blocks on fetch_balance, and
+        # reconciled against the exchange by a background task.
+        self._free: dict[str, float] = {}
+        self._free_version = 0
+        # Reconciling is skipped while nothing we did could have changed
+        # the balance; a periodic safety net still corrects silent drift.
+        self._balance_dirty = True
+        # Order-state cache fed by the private order-events stream, so
+        # live orders are inspected without a REST round-trip.
+        self._orders_by_id: dict[str, dict] = {}
 
     @abstractmethod
-    def _create_exchange(self) -> ccxt.Exchange:
-        """Return a configured ccxt exchange instance with API credentials."""
+    def _create_exchange(self) -> ccxt.async_support.Exchange:
+        """Return a configured async ccxt exchange instance with API credentials."""
         ...
 
-    def _load_markets(self) -> None:
-        """Pre-load exchange market data for precision info."""
-        try:
-            self.exchange.load_markets()
-        except Exception as e:
-            print(f"Error loading markets: {e}")
-
-    def _warmup_connection(self) -> None:
-        """Pre-warm the HTTP connection to reduce first-trade latency."""
-        try:
-            self.exchange.fetch_ticker("BTC/USDT")
-        except Exception:
-            pass
+    async def _next_order_book(self, pair: str) -> dict:
+        """Await the next order book state: a pushed delta when the exchange
+        streams its book, otherwise a REST snapshot."""
+        if self.exchange.has.get("watchOrderBook"):
+            return await self.exchange.watch_order_book(pair, limit=self.OB_DEPTH)
+        return await self.exchange.fetch_order_book(pair, limit=self.OB_DEPTH)
 
-    def get_price(self, pair: str) -> float:
+    async def get_price(self, pair: str) -> float:
         """Fetch the last traded price for a given pair."""
-        ticker = self.exchange.fetch_ticker(pair)
+        await self._rate_limiter.acquire()
+        ticker = await self.exchange.fetch_ticker(pair)
         return ticker["last"]
 
-    def get_available_coins(self, symbol: str) -> float:
-        """Return the free balance for a given symbol."""
-        while True:
-            try:
-                balance = self.exchange.fetch_balance()
-                break
-            except Exception:
-                time.sleep(0.2)
+    async def get_available_coins(self, symbol: str) -> float:
+        """Return the free balance for a given symbol.
+
+        Raises ccxt.ExchangeNotAvailable once the bounded retries are
+        exhausted instead of blocking the strategy forever.
+        """
+        balance = await self._retry(lambda: self.exchange.fetch_balance())
+        if balance is None:
+            raise ccxt.ExchangeNotAvailable(
+                f"{self.exchange.id}: balance unavailable after retries"
+            )
         if symbol not in balance:
             return 0
         return balance[symbol]["free"]
 
-    def strategy(
+    async def strategy(
         self,
         symbol: str,
         usd: float,
@@ -80,8 +126,62 @@ class BaseOrderBookTrader(ABC):
             dif_activate: Minimum spread percentage to activate buying.
             time_limit: Seconds after which new buy orders stop being placed.
         """
+        # Each run executes under its own asyncio.run in the worker, and a
+        # ccxt async client stays bound to the first loop it ever saw, so a
+        # fresh client is created per run.
+        self.exchange = self._create_exchange()
+        self._orders_by_id.clear()
+        self._colo_task = asyncio.create_task(self._check_colo())
+        try:
+            await self._strategy(symbol, usd, dif_activate, time_limit)
+        finally:
+            await self.exchange.close()
+
+    async def run_universe(
+        self,
+        symbols: list[str],
+        usd: float,
+        dif_activate: float,
+        time_limit: float,
+    ) -> None:
+        """Run the spread strategy across several symbols concurrently.
+
+        The per-symbol loops are gathered as tasks on one event loop, so
+        they multiplex over this client's single WebSocket/keep-alive
+        connection and share its order cache, balance ledger and
+        rate-limit bucket. Concurrent pumps scale linearly in symbols
+        without extra processes.
+        """
+        self.exchange = self._create_exchange()
+        self._orders_by_id.clear()
+        self._colo_task = asyncio.create_task(self._check_colo())
+        try:
+            results = await asyncio.gather(
+                *(self._strategy(symbol, usd, dif_activate, time_limit)
+                  for symbol in symbols),
+                return_exceptions=True,
+            )
+            for symbol, result in zip(symbols, results):
+                if isinstance(result, BaseException):
+                    logger.info(f"[BOOK] {symbol} loop failed: {result}")
+        finally:
+            await self.exchange.close()
+
+    async def _strategy(
+        self,
+        symbol: str,
+        usd: float,
+        dif_activate: float,
+        time_limit: float,
+    ) -> None:
         pair = f"{symbol}/USDT"
 
+        # Market metadata and the opening balance are independent; fetch
+        # them concurrently so startup pays one round-trip, not two.
+        _, opening_balance = await asyncio.gather(
+            self.exchange.load_markets(),
+            self.get_available_coins(symbol),
+        )
         market = self.exchange.markets[pair]
         price_precision = market["precision"]["price"]
         amount_precision = market["precision"]["amount"]
@@ -92,120 +192,352 @@ class BaseOrderBookTrader(ABC):
         sell_order = None
         sell_order_price = None
 
+        # Pending displaced orders: the cancel is fired together with the
+        # replacement instead of ahead of it.
+        replace_buy_id = None
+        replace_sell_id = None
+        replace_sell_amount = 0.0
+
+        # Seed the ledger once; afterwards the loop reads it locally and a
+        # background task corrects any drift every few seconds.
+        self._free[symbol] = opening_balance
+        reconcile_task = asyncio.create_task(self._reconcile_balance(symbol))
+        orders_task = asyncio.create_task(self._order_event_loop(pair))
+
+        # Hot-loop locals: every iteration otherwise pays attribute
+        # lookups on self for the same bound methods and ledger dict.
+        next_order_book = self._next_order_book
+        fetch_order_safe = self._fetch_order_safe
+        free_ledger = self._free
+
         start_time = time.time()
 
         while (time.time() - start_time) < 3600:
             # --- Fetch order book ---
             try:
-                order_book = self.exchange.fetch_order_book(pair)
+                order_book = await next_order_book(pair)
             except Exception:
                 continue
 
-            best_bid = order_book["bids"][0][0]
-            second_best_bid = order_book["bids"][1][0]
-            best_ask = order_book["asks"][0][0]
-            second_best_ask = order_book["asks"][1][0]
+            top = book_top(order_book)
+
+            # One open-orders request covers both sides when the event
+            # stream has not cached them yet, instead of two per-order
+            # fetches per iteration.
+            prefetched = {}
+            if (
+                buy_order is not None and sell_order is not None
+                and (buy_order["id"] not in self._orders_by_id
+                     or sell_order["id"] not in self._orders_by_id)
+            ):
+                for open_order in await self._fetch_open_orders_safe(pair):
+                    prefetched[open_order["id"]] = open_order
 
             # --- BUY SIDE: place limit buy when spread is wide ---
-            spread_pct = (best_ask - best_bid) / best_bid * 100
+            spread_pct = (top.best_ask - top.best_bid) / top.best_bid * 100
 
             if spread_pct > dif_activate:
                 if buy_order is not None:
-                    order_info = self._fetch_order_safe(buy_order["id"], pair)
-                    bid_gap = (best_bid - second_best_bid) / second_best_bid
-
-                    if order_info["status"] == "closed":
-                        print(f"[BOOK] Buy FILLED at {buy_order_price}")
+                    order_info = (
+                        prefetched.get(buy_order["id"])
+                        or await fetch_order_safe(buy_order["id"], pair)
+                    )
+                    bid_gap = (top.best_bid - top.second_best_bid) / top.second_best_bid
+
+                    state = (
+                        (order_info.get("status") == "closed")
+                        | ((top.best_bid > buy_order_price) << 1)
+                        | ((bid_gap > 0.2) << 2)
+                    )
+                    action = _ORDER_ACTIONS[state]
+
+                    if action == _ACT_FILLED:
+                        logger.info(f"[BOOK] Buy FILLED at {buy_order_price}")
+                        self._free[symbol] = (
+                            self._free.get(symbol, 0.0) + (order_info.get("filled") or 0)
+                        )
+                        self._free_version += 1
+                        self._balance_dirty = True
                         buy_order = None
                         buy_order_price = None
 
-                    elif best_bid > buy_order_price:
-                        print("[BOOK] Buy outbid, re-placing...")
-                        self._cancel_order_safe(buy_order["id"], pair)
+                    elif action != _ACT_NONE:
+                        logger.info("[BOOK] Buy displaced, re-placing...")
+                        replace_buy_id = buy_order["id"]
                         buy_order = None
                         buy_order_price = None
-
-                    elif bid_gap > 0.2:
-                        print(f"[BOOK] Buy gap too wide ({bid_gap:.2%}), re-placing...")
-                        self._cancel_order_safe(buy_order["id"], pair)
-                        buy_order = None
-                        buy_order_price = None
-                        best_bid = second_best_bid
+                        if action == _ACT_DISPLACED_SECOND:
+                            top.best_bid = top.second_best_bid
 
                 if buy_order is None and (time.time() - start_time) < time_limit:
-                    price = best_bid + min_increment
+                    price = top.best_bid + min_increment
                     buy_order_price = price
-                    amount = math.floor((usd / price) * 1e6) / 1e6
-                    buy_order = self._place_limit_buy_safe(pair, amount, price)
+                    amount = float(self.exchange.amount_to_precision(pair, usd / price))
+                    if replace_buy_id is not None:
+                        buy_order = await self._reprice(
+                            replace_buy_id, pair, "buy", amount, price
+                        )
+                        replace_buy_id = None
+                    else:
+                        buy_order = await self._place_limit_buy_safe(pair, amount, price)
                     if buy_order:
-                        print(f"[BOOK] Buy PLACED at {buy_order_price}")
+                        logger.info(f"[BOOK] Buy PLACED at {buy_order_price}")
+
+            if replace_buy_id is not None:
+                # Displaced buy that can no longer be re-placed (time limit
+                # hit or spread closed): just take it off the book.
+                await self._cancel_order_safe(replace_buy_id, pair)
+                replace_buy_id = None
 
             # --- SELL SIDE: place limit sell when coins are available ---
-            available_coins = self.get_available_coins(symbol)
+            available_coins = free_ledger.get(symbol, 0.0)
 
             if sell_order is not None:
-                order_info = self._fetch_order_safe(sell_order["id"], pair)
-                ask_gap = (second_best_ask - best_ask) / best_ask
-
-                if order_info["status"] == "closed":
-                    print(f"[BOOK] Sell FILLED at {sell_order_price}")
-                    sell_order = None
-                    sell_order_price = None
-
-                elif best_ask < sell_order_price or available_coins > amount_precision:
-                    print("[BOOK] Sell outbid or new coins, re-placing...")
-                    self._cancel_order_safe(sell_order["id"], pair)
+                order_info = (
+                    prefetched.get(sell_order["id"])
+                    or await fetch_order_safe(sell_order["id"], pair)
+                )
+                ask_gap = (top.second_best_ask - top.best_ask) / top.best_ask
+
+                state = (
+                    (order_info.get("status") == "closed")
+                    | ((top.best_ask < sell_order_price
+                        or available_coins > amount_precision) << 1)
+                    | ((ask_gap > 0.3) << 2)
+                )
+                action = _ORDER_ACTIONS[state]
+
+                if action == _ACT_FILLED:
+                    logger.info(f"[BOOK] Sell FILLED at {sell_order_price}")
                     sell_order = None
                     sell_order_price = None
-                    available_coins = self.get_available_coins(symbol)
 
-                elif ask_gap > 0.3:
-                    print(f"[BOOK] Sell gap too wide ({ask_gap:.2%}), re-placing...")
-                    self._cancel_order_safe(sell_order["id"], pair)
+                elif action != _ACT_NONE:
+                    logger.info("[BOOK] Sell displaced, re-placing...")
+                    # The coins locked in the displaced order are not free
+                    # until the cancel lands, so the replacement size is the
+                    # current free balance plus the order's remainder.
+                    replace_sell_id = sell_order["id"]
+                    replace_sell_amount = available_coins + (order_info.get("remaining") or 0)
                     sell_order = None
                     sell_order_price = None
-                    best_ask = second_best_ask
-                    available_coins = self.get_available_coins(symbol)
+                    if action == _ACT_DISPLACED_SECOND:
+                        top.best_ask = top.second_best_ask
 
-            if available_coins > amount_precision and sell_order is None:
-                price = best_ask - min_increment
+            if sell_order is None and (
+                replace_sell_id is not None or available_coins > amount_precision
+            ):
+                price = top.best_ask - min_increment
                 sell_order_price = price
-                sell_order = self._place_limit_sell_safe(pair, available_coins, price)
-                print(f"[BOOK] Sell PLACED at {sell_order_price}")
+                replaced_sell = replace_sell_id is not None
+                try:
+                    if replaced_sell:
+                        sell_order = await self._reprice(
+                            replace_sell_id, pair, "sell", replace_sell_amount, price
+                        )
+                        replace_sell_id = None
+                    else:
+                        sell_order = await self._place_limit_sell_safe(pair, available_coins, price)
+                except ccxt.ExchangeNotAvailable as e:
+                    logger.info(f"[BOOK] Exchange unavailable, re-entering loop: {e}")
+                    continue
+                if sell_order:
+                    self._free[symbol] = 0.0 if replaced_sell else max(
+                        0.0, self._free.get(symbol, 0.0) - available_coins
+                    )
+                    self._free_version += 1
+                    self._balance_dirty = True
+                    logger.info(f"[BOOK] Sell PLACED at {sell_order_price}")
+
+        reconcile_task.cancel()
+        orders_task.cancel()
 
     # --- Internal helpers ---
 
-    def _fetch_order_safe(self, order_id: str, pair: str) -> dict:
-        """Fetch order info with retries."""
-        for _ in range(10):
-            try:
-                return self.exchange.fetch_order(order_id, pair)
-            except Exception:
-                time.sleep(0.2)
-        return {}
+    async def _check_colo(self) -> None:
+        """Warn when the client is not co-located with the exchange's edge.
 
-    def _cancel_order_safe(self, order_id: str, pair: str) -> None:
-        """Cancel an order with retries."""
-        for attempt in range(10):
+        Every round-trip in the trading loops pays for the geographic
+        distance, so deployments should pin the region declared by the
+        subclass. Runs as a fire-and-forget task off the hot path.
+        """
+        if self.PREFERRED_REGION is None or self._colo_checked:
+            return
+        self._colo_checked = True
+        try:
+            import aiohttp
+            async with aiohttp.ClientSession() as session:
+                async with session.get(
+                    "https://www.cloudflare.com/cdn-cgi/trace", timeout=aiohttp.ClientTimeout(total=5)
+                ) as response:
+                    trace = await response.text()
+            colo = dict(
+                line.split("=", 1) for line in trace.strip().splitlines() if "=" in line
+            ).get("colo")
+            if colo and colo != self.PREFERRED_REGION:
+                logger.info(
+                    f"[COLO] Client at Cloudflare edge {colo}, but "
+                    f"{self.exchange.id} is fastest from {self.PREFERRED_REGION}; "
+                    "consider moving the deployment."
+                )
+        except Exception:
+            pass
+
+    async def _retry(self, fn, max_tries: int = 10, base: float = 0.05, cap: float = 2.0):
+        """Run an awaitable factory with exponential backoff and jitter.
+
+        Transient failures retry almost immediately and sustained outages
+        back off toward `cap` seconds, with jitter so parallel loops do
+        not retry in lockstep. Rate-limit rejections wait the exchange's
+        declared interval instead of hammering it. Returns None when
+        every attempt failed.
+        """
+        for attempt in range(max_tries):
+            await self._rate_limiter.acquire()
             try:
-                self.exchange.cancel_order(order_id, pair)
-                return
+                return await fn()
+            except ccxt.RateLimitExceeded:
+                await asyncio.sleep(max(self.exchange.rateLimit / 1000.0, base))
             except Exception:
-                time.sleep(0.2)
+                delay = min(cap, base * 2 ** attempt) * (0.5 + random.random())
+                await asyncio.sleep(delay)
+        return None
 
-    def _place_limit_buy_safe(self, pair: str, amount: float, price: float) -> dict | None:
-        """Place a limit buy order with limited retries."""
-        for _ in range(3):
+    async def _order_event_loop(self, pair: str) -> None:
+        """Mirror the private order-events stream into the order cache.
+
+        Exchanges without a private stream leave the cache empty and the
+        readers fall back to REST."""
+        if not self.exchange.has.get("watchOrders"):
+            return
+        while True:
             try:
-                return self.exchange.create_limit_buy_order(pair, amount, price)
+                orders = await self.exchange.watch_orders(pair)
             except Exception:
-                time.sleep(0.2)
-        return None
+                await asyncio.sleep(1)
+                continue
+            for order in orders:
+                self._orders_by_id[order["id"]] = order
 
-    def _place_limit_sell_safe(self, pair: str, amount: float, price: float) -> dict:
-        """Place a limit sell order with infinite retries."""
+    async def _reconcile_balance(self, symbol: str, interval: float = 5.0,
+                                 force_every: int = 6) -> None:
+        """Periodically re-sync the free-balance ledger with the exchange
+        to correct drift from fills the loop did not observe.
+
+        Fetches only when our own activity marked the balance dirty, with
+        every sixth tick forced as a safety net against silent drift."""
+        ticks = 0
         while True:
+            await asyncio.sleep(interval)
+            ticks += 1
+            if not self._balance_dirty and ticks % force_every:
+                continue
+            self._balance_dirty = False
+            version = self._free_version
             try:
-                return self.exchange.create_limit_sell_order(pair, amount, price)
+                await self._rate_limiter.acquire()
+                balance = await self.exchange.fetch_balance()
             except Exception:
-                time.sleep(0.2)
+                self._balance_dirty = True  # keep the signal for the next tick
+                continue
+            # Skip the write if the loop touched the ledger while this
+            # snapshot was in flight; the stale value would undo it.
+            if self._free_version == version:
+                self._free[symbol] = balance[symbol]["free"] if symbol in balance else 0.0
+
+    async def _reprice(self, old_id: str, pair: str, side: str,
+                       amount: float, price: float) -> dict | None:
+        """Re-price an order in one call where the exchange supports it.
+
+        editOrder atomically replaces the resting order server-side, so
+        there is no window with nothing on the book and only one HTTP
+        round-trip; exchanges without it fall back to the concurrent
+        cancel+create path.
+        """
+        if self.exchange.has.get("editOrder"):
+            order = await self._retry(
+                lambda: self.exchange.edit_order(
+                    old_id, pair, "limit", side, amount, price
+                ),
+                max_tries=3,
+            )
+            if order is not None:
+                return order
+        return await self._replace_order(old_id, pair, side, amount, price)
+
+    async def _replace_order(self, old_id: str, pair: str, side: str,
+                             amount: float, price: float) -> dict | None:
+        """Cancel an order and submit its replacement concurrently.
+
+        The cancel response is not needed before the new order can go
+        out, so both requests are dispatched in the same event-loop tick,
+        halving the window with no order on the book. The create helpers
+        retry, which also absorbs the race where the replacement briefly
+        lacks the funds still locked in the order being cancelled.
+        """
+        if side == "buy":
+            _, new_order = await asyncio.gather(
+                self._cancel_order_safe(old_id, pair),
+                self._place_limit_buy_safe(pair, amount, price),
+            )
+            return new_order
+
+        _, new_order = await asyncio.gather(
+            self._cancel_order_safe(old_id, pair),
+            self._place_limit_sell_bounded(pair, amount, price),
+        )
+        if new_order is None:
+            # The displaced order may have filled during the race, making
+            # the optimistic amount unsellable; fall back to what is
+            # actually free now.
+            amount = await self.get_available_coins(pair.split("/")[0])
+            if amount <= 0:
+                return None
+            new_order = await self._place_limit_sell_safe(pair, amount, price)
+        return new_order
+
+    async def _place_limit_sell_bounded(self, pair: str, amount: float,
+                                        price: float) -> dict | None:
+        """Place a limit sell with bounded retries (None on failure)."""
+        return await self._retry(
+            lambda: self.exchange.create_limit_sell_order(pair, amount, price)
+        )
+
+    async def _fetch_open_orders_safe(self, pair: str) -> list[dict]:
+        """Fetch all open orders for a pair with retries (empty on failure)."""
+        orders = await self._retry(lambda: self.exchange.fetch_open_orders(pair))
+        return orders if orders is not None else []
+
+    async def _fetch_order_safe(self, order_id: str, pair: str) -> dict:
+        """Return order state from the push-fed cache, REST as fallback.
+
+        Only the event stream writes the cache, so a REST result is never
+        frozen in as stale state on exchanges without the stream.
+        """
+        cached = self._orders_by_id.get(order_id)
+        if cached is not None:
+            return cached
+        order = await self._retry(lambda: self.exchange.fetch_order(order_id, pair))
+        return order if order is not None else {}
+
+    async def _cancel_order_safe(self, order_id: str, pair: str) -> None:
+        """Cancel an order with retries."""
+        await self._retry(lambda: self.exchange.cancel_order(order_id, pair))
+
+    async def _place_limit_buy_safe(self, pair: str, amount: float, price: float) -> dict | None:
+        """Place a limit buy order with limited retries."""
+        return await self._retry(
+            lambda: self.exchange.create_limit_buy_order(pair, amount, price),
+            max_tries=3,
+        )
+
+    async def _place_limit_sell_safe(self, pair: str, amount: float, price: float) -> dict:
+        """Place a limit sell order, raising once bounded retries fail."""
+        order = await self._retry(
+            lambda: self.exchange.create_limit_sell_order(pair, amount, price)
+        )
+        if order is None:
+            raise ccxt.ExchangeNotAvailable(
+                f"{self.exchange.id}: could not place sell {pair} after retries"
+            )
+        return order
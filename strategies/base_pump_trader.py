@@ -9,28 +9,81 @@ Implements the core buy-and-sell logic used across all exchanges:
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+import random
 import time
-import math
 import ccxt
+import ccxt.async_support
 from colorama import Fore, Style
 
+from strategies.book import BookTop
+from strategies.log import get_logger
+from strategies.ratelimit import RateLimiter
+
+logger = get_logger(__name__)
+
+# Action codes for a live order, resolved from a branchlessly-computed
+# state mask (bit 0: filled, bit 1: displaced from the top, bit 2: level
+# gap too wide). The table encodes the branch priority - filled wins,
+# then displacement, then the gap re-place toward the second level.
+_ACT_NONE, _ACT_FILLED, _ACT_DISPLACED, _ACT_DISPLACED_SECOND = range(4)
+_ORDER_ACTIONS = tuple(
+    _ACT_FILLED if state & 1
+    else _ACT_DISPLACED if state & 2
+    else _ACT_DISPLACED_SECOND if state & 4
+    else _ACT_NONE
+    for state in range(8)
+)
+
 
 class BasePumpTrader(ABC):
     """Abstract base for exchange-specific pump traders.
 
     Subclasses must implement `_create_exchange()` to return a configured
-    ccxt exchange instance. Override `_market_buy_uses_cost` to indicate
-    whether the exchange's market buy accepts a USD cost (True) or a
-    token amount (False).
+    async ccxt exchange instance. Override `_market_buy_uses_cost` to
+    indicate whether the exchange's market buy accepts a USD cost (True)
+    or a token amount (False).
+
+    All trading methods are coroutines driven by one event loop per trade
+    (`asyncio.run` in the worker process); order book updates arrive over
+    WebSocket where the exchange supports it, so the exit loops react to
+    pushed deltas instead of polling REST.
     """
 
+    # Cloudflare edge (IATA code) the exchange's API is fastest from;
+    # subclasses set it where known so deployments can be placed there.
+    PREFERRED_REGION: str | None = None
+
+    # Order book depth to request. The loops only read the top two
+    # levels, so shrinking the payload 10-100x cuts transfer and parse
+    # cost; subclasses can override for exchanges that want a specific
+    # depth (or None to take the exchange default).
+    OB_DEPTH: int | None = 5
+
     def __init__(self) -> None:
-        self.exchange: ccxt.Exchange = self._create_exchange()
-        self._warmup_connection()
+        self.exchange: ccxt.async_support.Exchange = self._create_exchange()
+        # One bucket paced from the exchange's declared request interval,
+        # shared by every REST helper on this client.
+        self._rate_limiter = RateLimiter(1000.0 / max(self.exchange.rateLimit or 0, 1))
+        self._colo_checked = False
+        # Local free-balance ledger: updated from our own placements and
+        # fills so the exit loop never blocks on fetch_balance, and
+        # reconciled against the exchange by a background task.
+        self._free: dict[str, float] = {}
+        self._free_version = 0
+        # Reconciling is skipped while nothing we did could have changed
+        # the balance; a periodic safety net still corrects silent drift.
+        self._balance_dirty = True
+        # Order-state cache fed by the private order-events stream, so
+        # live orders are inspected without a REST round-trip.
+        self._orders_by_id: dict[str, dict] = {}
+        # Signalled on each order event; last streamed price per pair.
+        self._order_event: asyncio.Event | None = None
+        self._last_price: dict[str, float] = {}
 
     @abstractmethod
-    def _create_exchange(self) -> ccxt.Exchange:
-        """Return a configured ccxt exchange instance with API credentials."""
+    def _create_exchange(self) -> ccxt.async_support.Exchange:
+        """Return a configured async ccxt exchange instance with API credentials."""
         ...
 
     @property
@@ -38,31 +91,35 @@ class BasePumpTrader(ABC):
         """If True, create_market_buy_order receives USD cost instead of token amount."""
         return False
 
-    def _warmup_connection(self) -> None:
-        """Pre-warm the HTTP connection to reduce latency on the first real trade."""
-        try:
-            self.exchange.fetch_ticker("BTC/USDT")
-        except Exception:
-            pass
+    async def _next_order_book(self, pair: str) -> dict:
+        """Await the next order book state: a pushed delta when the exchange
+        streams its book, otherwise a REST snapshot."""
+        if self.exchange.has.get("watchOrderBook"):
+            return await self.exchange.watch_order_book(pair, limit=self.OB_DEPTH)
+        return await self.exchange.fetch_order_book(pair, limit=self.OB_DEPTH)
 
-    def get_price(self, pair: str) -> float:
+    async def get_price(self, pair: str) -> float:
         """Fetch the last traded price for a given pair."""
-        ticker = self.exchange.fetch_ticker(pair)
+        await self._rate_limiter.acquire()
+        ticker = await self.exchange.fetch_ticker(pair)
         return ticker["last"]
 
-    def get_available_coins(self, symbol: str) -> float:
-        """Return the free balance for a given symbol."""
-        while True:
-            try:
-                balance = self.exchange.fetch_balance()
-                break
-            except Exception:
-                time.sleep(0.2)
+    async def get_available_coins(self, symbol: str) -> float:
+        """Return the free balance for a given symbol.
+
+        Raises ccxt.ExchangeNotAvailable once the bounded retries are
+        exhausted instead of blocking the strategy forever.
+        """
+        balance = await self._retry(lambda: self.exchange.fetch_balance())
+        if balance is None:
+            raise ccxt.ExchangeNotAvailable(
+                f"{self.exchange.id}: balance unavailable after retries"
+            )
         if symbol not in balance:
             return 0
         return balance[symbol]["free"]
 
-    def buy_and_sell(
+    async def buy_and_sell(
         self,
         symbol: str,
         usd: float,
@@ -85,51 +142,86 @@ class BasePumpTrader(ABC):
             min_up_start_time: Minimum price increase to start partial timer.
             slippage: Maximum acceptable slippage (currently used for logging).
         """
+        # Each trade runs under its own asyncio.run in the worker, and a
+        # ccxt async client stays bound to the first loop it ever saw, so a
+        # fresh client is created per run.
+        self.exchange = self._create_exchange()
+        self._colo_task = asyncio.create_task(self._check_colo())
+        try:
+            await self._buy_and_sell(
+                symbol, usd, benefit_partial, benefit_total,
+                time_limit_partial, time_limit_total, min_up_start_time, slippage,
+            )
+        finally:
+            await self.exchange.close()
+
+    async def _buy_and_sell(
+        self,
+        symbol: str,
+        usd: float,
+        benefit_partial: float,
+        benefit_total: float,
+        time_limit_partial: float,
+        time_limit_total: float,
+        min_up_start_time: float,
+        slippage: float,
+    ) -> None:
         pair = f"{symbol}/USDT"
 
         # --- Phase 1: Market Buy ---
-        order_book = self._fetch_order_book_safe(pair)
+        order_book = await self._fetch_order_book_safe(pair)
         if order_book is None:
             return
 
         best_ask = order_book["asks"][:5]
         best_bid = order_book["bids"][:5]
-        print(f"ASK: {best_ask}")
-        print(f"BID: {best_bid}")
+        logger.info(f"ASK: {best_ask}")
+        logger.info(f"BID: {best_bid}")
 
-        order = self._execute_market_buy(pair, usd, order_book)
+        order = await self._execute_market_buy(pair, usd, order_book)
         if order is None:
             return
 
         start_time = time.time()
-        print("Buy order executed")
+        logger.info("Buy order executed")
 
         # --- Phase 2: Wait for fill ---
-        order_info = self._wait_for_fill(order, pair)
+        order_info = await self._wait_for_fill(order, pair)
         buy_price = order_info["average"]
 
         # --- Phase 3: Place take-profit sell ---
-        available_coins = self.get_available_coins(symbol)
-        sell_price = buy_price * (1 + benefit_total)
-
-        sell_order = self._place_limit_sell(pair, available_coins, sell_price)
+        try:
+            available_coins = await self.get_available_coins(symbol)
+            sell_price = buy_price * (1 + benefit_total)
+            sell_order = await self._place_limit_sell(pair, available_coins, sell_price)
+        except ccxt.ExchangeNotAvailable as e:
+            # We hold a position and cannot rest a take-profit; fall back
+            # to track_sell, which keeps attempting an exit for an hour.
+            logger.info(f"Take-profit placement failed ({e}), tracking exit instead")
+            await self.track_sell(symbol)
+            return
         sell_order_id = sell_order["id"]
-        print("Sell order placed")
+        logger.info("Sell order placed")
 
         # --- Phase 4: Monitor and manage exit ---
+        # Order state comes from the push-fed cache and price from the
+        # streamed ticker; the loop sleeps on the order event with a
+        # deadline-bounded timeout instead of a blind 300 ms interval, so
+        # a fill wakes it instantly while timers still fire promptly.
         partial_sell = False
         start_partial_time = -1
 
+        self._order_event = asyncio.Event()
+        self._orders_by_id.clear()
+        orders_task = asyncio.create_task(self._order_event_loop(pair))
+        ticker_task = asyncio.create_task(self._ticker_event_loop(pair))
+
         while True:
-            try:
-                order_status = self.exchange.fetch_order(sell_order_id, pair)
-            except Exception:
-                time.sleep(0.2)
-                continue
+            order_status = await self._fetch_order_safe(sell_order_id, pair)
 
-            if order_status["status"] == "closed":
+            if order_status.get("status") == "closed":
                 profit = usd * (benefit_partial if partial_sell else benefit_total)
-                print(f"{Fore.GREEN} Profit: {profit:.4f} $ {Style.RESET_ALL}")
+                logger.info(f"{Fore.GREEN} Profit: {profit:.4f} $ {Style.RESET_ALL}")
                 break
 
             elapsed_total = time.time() - start_time
@@ -137,7 +229,9 @@ class BasePumpTrader(ABC):
             # Check if price has risen enough to start partial timer
             if start_partial_time == -1:
                 try:
-                    current_price = self.get_price(pair)
+                    current_price = self._last_price.get(pair)
+                    if current_price is None:
+                        current_price = await self.get_price(pair)
                     price_change = (current_price / buy_price) - 1
                     if price_change > min_up_start_time:
                         start_partial_time = time.time()
@@ -150,21 +244,41 @@ class BasePumpTrader(ABC):
 
             # Switch to partial take-profit
             if not partial_sell and elapsed_partial > time_limit_partial:
-                self._cancel_order_safe(sell_order_id, pair)
+                await self._cancel_order_safe(sell_order_id, pair)
                 sell_price = buy_price * (1 + benefit_partial)
-                sell_order = self._place_limit_sell(pair, available_coins, sell_price)
+                try:
+                    sell_order = await self._place_limit_sell(pair, available_coins, sell_price)
+                except ccxt.ExchangeNotAvailable as e:
+                    logger.info(f"Partial take-profit failed ({e}), retrying")
+                    continue
                 sell_order_id = sell_order["id"]
                 partial_sell = True
 
             # Total timeout: fall back to track_sell
             if elapsed_total > time_limit_total:
-                self._cancel_order_safe(sell_order_id, pair)
-                self.track_sell(symbol)
+                await self._cancel_order_safe(sell_order_id, pair)
+                orders_task.cancel()
+                ticker_task.cancel()
+                await self.track_sell(symbol)
                 break
 
-            time.sleep(0.3)
+            remaining = time_limit_total - (time.time() - start_time)
+            if not partial_sell and start_partial_time != -1:
+                remaining = min(
+                    remaining, time_limit_partial - (time.time() - start_partial_time)
+                )
+            try:
+                await asyncio.wait_for(
+                    self._order_event.wait(), max(0.05, min(remaining, 0.3))
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._order_event.clear()
+
+        orders_task.cancel()
+        ticker_task.cancel()
 
-    def track_sell(self, symbol: str) -> None:
+    async def track_sell(self, symbol: str) -> None:
         """Continuously adjust a limit sell to undercut the best ask.
 
         Places a sell order just below the best ask price and monitors
@@ -180,82 +294,288 @@ class BasePumpTrader(ABC):
 
         sell_order = None
         sell_order_price = None
+
+        # Pending displaced order: the cancel is fired together with the
+        # replacement instead of ahead of it.
+        replace_sell_id = None
+        replace_sell_amount = 0.0
+
+        # Seed the ledger once; afterwards the loop reads it locally and a
+        # background task corrects any drift every few seconds.
+        try:
+            self._free[symbol] = await self.get_available_coins(symbol)
+        except ccxt.ExchangeNotAvailable:
+            self._free[symbol] = 0.0  # reconcile task fills this in later
+        self._orders_by_id.clear()
+        reconcile_task = asyncio.create_task(self._reconcile_balance(symbol))
+        orders_task = asyncio.create_task(self._order_event_loop(pair))
+
+        # Hot-loop locals: every iteration otherwise pays attribute
+        # lookups on self for the same bound methods and ledger dict.
+        next_order_book = self._next_order_book
+        fetch_order_safe = self._fetch_order_safe
+        free_ledger = self._free
+
         start_time = time.time()
 
         while (time.time() - start_time) < 3600:
             try:
-                order_book = self.exchange.fetch_order_book(pair)
+                order_book = await next_order_book(pair)
             except Exception:
                 continue
 
-            best_ask = order_book["asks"][0][0]
-            second_best_ask = order_book["asks"][1][0]
+            # track_sell only works the ask side; the bid fields stay NaN.
+            asks = order_book["asks"]
+            top = BookTop(float("nan"), float("nan"), asks[0][0], asks[1][0], time.time())
 
-            available_coins = self.get_available_coins(symbol)
+            available_coins = free_ledger.get(symbol, 0.0)
 
             if sell_order is not None:
-                order_info = self._fetch_order_safe(sell_order["id"], pair)
-                spread_ratio = (second_best_ask - best_ask) / best_ask
-
-                if order_info["status"] == "closed":
-                    print(f"[TRACK] Sell FILLED at {sell_order_price}")
-                    sell_order = None
-                    sell_order_price = None
+                order_info = await fetch_order_safe(sell_order["id"], pair)
+                spread_ratio = (top.second_best_ask - top.best_ask) / top.best_ask
+
+                state = (
+                    (order_info.get("status") == "closed")
+                    | ((top.best_ask < sell_order_price
+                        or available_coins > amount_precision) << 1)
+                    | ((spread_ratio > 0.3) << 2)
+                )
+                action = _ORDER_ACTIONS[state]
 
-                elif best_ask < sell_order_price or available_coins > amount_precision:
-                    print(f"[TRACK] Outbid or new coins available, re-placing order...")
-                    self._cancel_order_safe(sell_order["id"], pair)
+                if action == _ACT_FILLED:
+                    logger.info(f"[TRACK] Sell FILLED at {sell_order_price}")
                     sell_order = None
                     sell_order_price = None
-                    available_coins = self.get_available_coins(symbol)
 
-                elif spread_ratio > 0.3:
-                    print(f"[TRACK] Spread too wide ({spread_ratio:.2%}), re-placing...")
-                    self._cancel_order_safe(sell_order["id"], pair)
+                elif action != _ACT_NONE:
+                    logger.info("[TRACK] Sell displaced, re-placing...")
+                    # The coins locked in the displaced order are not free
+                    # until the cancel lands, so the replacement size is the
+                    # current free balance plus the order's remainder.
+                    replace_sell_id = sell_order["id"]
+                    replace_sell_amount = available_coins + (order_info.get("remaining") or 0)
                     sell_order = None
                     sell_order_price = None
-                    best_ask = second_best_ask
-                    available_coins = self.get_available_coins(symbol)
+                    if action == _ACT_DISPLACED_SECOND:
+                        top.best_ask = top.second_best_ask
 
-            if available_coins > amount_precision and sell_order is None:
-                price = best_ask - min_increment
+            if sell_order is None and (
+                replace_sell_id is not None or available_coins > amount_precision
+            ):
+                price = top.best_ask - min_increment
                 sell_order_price = price
-                sell_order = self._place_limit_sell(pair, available_coins, price)
-                print(f"[TRACK] Sell PLACED at {sell_order_price}")
+                replaced_sell = replace_sell_id is not None
+                try:
+                    if replaced_sell:
+                        sell_order = await self._reprice_sell(
+                            replace_sell_id, pair, replace_sell_amount, price
+                        )
+                        replace_sell_id = None
+                    else:
+                        sell_order = await self._place_limit_sell(pair, available_coins, price)
+                except ccxt.ExchangeNotAvailable as e:
+                    logger.info(f"[TRACK] Exchange unavailable, re-entering loop: {e}")
+                    continue
+                if sell_order:
+                    self._free[symbol] = 0.0 if replaced_sell else max(
+                        0.0, self._free.get(symbol, 0.0) - available_coins
+                    )
+                    self._free_version += 1
+                    self._balance_dirty = True
+                    logger.info(f"[TRACK] Sell PLACED at {sell_order_price}")
+
+        reconcile_task.cancel()
+        orders_task.cancel()
 
     # --- Internal helpers ---
 
-    def _fetch_order_book_safe(self, pair: str, max_retries: int = 10) -> dict | None:
-        """Fetch order book with retries."""
-        for attempt in range(max_retries):
+    async def _check_colo(self) -> None:
+        """Warn when the client is not co-located with the exchange's edge.
+
+        Every round-trip in the trading loops pays for the geographic
+        distance, so deployments should pin the region declared by the
+        subclass. Runs as a fire-and-forget task off the hot path.
+        """
+        if self.PREFERRED_REGION is None or self._colo_checked:
+            return
+        self._colo_checked = True
+        try:
+            import aiohttp
+            async with aiohttp.ClientSession() as session:
+                async with session.get(
+                    "https://www.cloudflare.com/cdn-cgi/trace", timeout=aiohttp.ClientTimeout(total=5)
+                ) as response:
+                    trace = await response.text()
+            colo = dict(
+                line.split("=", 1) for line in trace.strip().splitlines() if "=" in line
+            ).get("colo")
+            if colo and colo != self.PREFERRED_REGION:
+                logger.info(
+                    f"[COLO] Client at Cloudflare edge {colo}, but "
+                    f"{self.exchange.id} is fastest from {self.PREFERRED_REGION}; "
+                    "consider moving the deployment."
+                )
+        except Exception:
+            pass
+
+    async def _retry(self, fn, max_tries: int = 10, base: float = 0.05, cap: float = 2.0):
+        """Run an awaitable factory with exponential backoff and jitter.
+
+        Transient failures retry almost immediately and sustained outages
+        back off toward `cap` seconds, with jitter so parallel loops do
+        not retry in lockstep. Rate-limit rejections wait the exchange's
+        declared interval instead of hammering it. Returns None when
+        every attempt failed.
+        """
+        for attempt in range(max_tries):
+            await self._rate_limiter.acquire()
             try:
-                return self.exchange.fetch_order_book(pair)
+                return await fn()
+            except ccxt.RateLimitExceeded:
+                await asyncio.sleep(max(self.exchange.rateLimit / 1000.0, base))
             except Exception:
-                time.sleep(0.2)
+                delay = min(cap, base * 2 ** attempt) * (0.5 + random.random())
+                await asyncio.sleep(delay)
         return None
 
-    def _execute_market_buy(self, pair: str, usd: float, order_book: dict) -> dict | None:
+    async def _order_event_loop(self, pair: str) -> None:
+        """Mirror the private order-events stream into the order cache.
+
+        Exchanges without a private stream leave the cache empty and the
+        readers fall back to REST."""
+        if not self.exchange.has.get("watchOrders"):
+            return
+        while True:
+            try:
+                orders = await self.exchange.watch_orders(pair)
+            except Exception:
+                await asyncio.sleep(1)
+                continue
+            for order in orders:
+                self._orders_by_id[order["id"]] = order
+            if self._order_event is not None:
+                self._order_event.set()
+
+    async def _ticker_event_loop(self, pair: str) -> None:
+        """Mirror the ticker stream into _last_price for no-cost reads."""
+        if not self.exchange.has.get("watchTicker"):
+            return
+        while True:
+            try:
+                ticker = await self.exchange.watch_ticker(pair)
+            except Exception:
+                await asyncio.sleep(1)
+                continue
+            if ticker["last"] is not None:
+                self._last_price[pair] = ticker["last"]
+
+    async def _reconcile_balance(self, symbol: str, interval: float = 5.0,
+                                 force_every: int = 6) -> None:
+        """Periodically re-sync the free-balance ledger with the exchange
+        to correct drift from fills the loop did not observe.
+
+        Fetches only when our own activity marked the balance dirty, with
+        every sixth tick forced as a safety net against silent drift."""
+        ticks = 0
+        while True:
+            await asyncio.sleep(interval)
+            ticks += 1
+            if not self._balance_dirty and ticks % force_every:
+                continue
+            self._balance_dirty = False
+            version = self._free_version
+            try:
+                await self._rate_limiter.acquire()
+                balance = await self.exchange.fetch_balance()
+            except Exception:
+                self._balance_dirty = True  # keep the signal for the next tick
+                continue
+            # Skip the write if the loop touched the ledger while this
+            # snapshot was in flight; the stale value would undo it.
+            if self._free_version == version:
+                self._free[symbol] = balance[symbol]["free"] if symbol in balance else 0.0
+
+    async def _reprice_sell(self, old_id: str, pair: str,
+                            amount: float, price: float) -> dict | None:
+        """Re-price a sell in one call where the exchange supports it.
+
+        editOrder atomically replaces the resting order server-side, so
+        there is no window with nothing on the book and only one HTTP
+        round-trip; exchanges without it fall back to the concurrent
+        cancel+create path.
+        """
+        if self.exchange.has.get("editOrder"):
+            order = await self._retry(
+                lambda: self.exchange.edit_order(
+                    old_id, pair, "limit", "sell", amount, price
+                ),
+                max_tries=3,
+            )
+            if order is not None:
+                return order
+        return await self._replace_sell_order(old_id, pair, amount, price)
+
+    async def _replace_sell_order(self, old_id: str, pair: str,
+                                  amount: float, price: float) -> dict | None:
+        """Cancel a sell order and submit its replacement concurrently.
+
+        The cancel response is not needed before the new order can go
+        out, so both requests are dispatched in the same event-loop tick,
+        halving the window with no order on the book. _place_limit_sell
+        retries, which also absorbs the race where the replacement
+        briefly lacks the coins still locked in the cancelled order.
+        """
+        _, new_order = await asyncio.gather(
+            self._cancel_order_safe(old_id, pair),
+            self._place_limit_sell_bounded(pair, amount, price),
+        )
+        if new_order is None:
+            # The displaced order may have filled during the race, making
+            # the optimistic amount unsellable; fall back to what is
+            # actually free now.
+            amount = await self.get_available_coins(pair.split("/")[0])
+            if amount <= 0:
+                return None
+            new_order = await self._place_limit_sell(pair, amount, price)
+        return new_order
+
+    async def _place_limit_sell_bounded(self, pair: str, amount: float,
+                                        price: float) -> dict | None:
+        """Place a limit sell with bounded retries (None on failure)."""
+        return await self._retry(
+            lambda: self.exchange.create_limit_sell_order(pair, amount, price)
+        )
+
+    async def _fetch_order_book_safe(self, pair: str, max_retries: int = 10) -> dict | None:
+        """Fetch order book with retries."""
+        return await self._retry(
+            lambda: self.exchange.fetch_order_book(pair, limit=self.OB_DEPTH),
+            max_tries=max_retries,
+        )
+
+    async def _execute_market_buy(self, pair: str, usd: float, order_book: dict) -> dict | None:
         """Execute a market buy with up to 10 retries, reducing size on failure."""
         buy_arg = usd  # cost or amount depending on exchange
 
         if not self._market_buy_uses_cost:
             ask_price = order_book["asks"][0][0]
-            buy_arg = math.floor((usd / ask_price) * 1e6) / 1e6
+            buy_arg = float(self.exchange.amount_to_precision(pair, usd / ask_price))
 
         for attempt in range(10):
+            await self._rate_limiter.acquire()
             try:
-                return self.exchange.create_market_buy_order(pair, buy_arg)
+                return await self.exchange.create_market_buy_order(pair, buy_arg)
             except Exception as e:
-                print(f"Buy attempt {attempt + 1} failed: {e}")
+                logger.info(f"Buy attempt {attempt + 1} failed: {e}")
                 buy_arg = (
                     round(buy_arg * 0.7, 2)
                     if self._market_buy_uses_cost
-                    else math.floor((buy_arg * 0.7) * 1e6) / 1e6
+                    else float(self.exchange.amount_to_precision(pair, buy_arg * 0.7))
                 )
-                time.sleep(0.2)
+                await asyncio.sleep(0.2)
         return None
 
-    def _wait_for_fill(self, order: dict, pair: str, timeout: float = 2.0) -> dict:
+    async def _wait_for_fill(self, order: dict, pair: str, timeout: float = 2.0) -> dict:
         """Wait for a buy order to be filled, with timeout."""
         start = time.time()
         order_info = order
@@ -263,39 +583,45 @@ class BasePumpTrader(ABC):
             if time.time() - start > timeout:
                 break
             try:
-                order_info = self.exchange.fetch_order(order["id"], pair)
+                await self._rate_limiter.acquire()
+                order_info = await self.exchange.fetch_order(order["id"], pair)
                 if order_info["status"] == "closed":
                     break
                 if order_info["status"] == "ORDER_STATUS_REJECTED":
-                    order = self.exchange.create_market_buy_order(
+                    order = await self.exchange.create_market_buy_order(
                         pair, order["amount"]
                     )
             except Exception:
-                time.sleep(0.2)
+                await asyncio.sleep(0.2)
         return order_info
 
-    def _place_limit_sell(self, pair: str, amount: float, price: float) -> dict:
-        """Place a limit sell order with infinite retries."""
-        while True:
-            try:
-                return self.exchange.create_limit_sell_order(pair, amount, price)
-            except Exception:
-                time.sleep(0.2)
+    async def _place_limit_sell(self, pair: str, amount: float, price: float) -> dict:
+        """Place a limit sell order, raising once bounded retries fail."""
+        order = await self._retry(
+            lambda: self.exchange.create_limit_sell_order(pair, amount, price)
+        )
+        if order is None:
+            raise ccxt.ExchangeNotAvailable(
+                f"{self.exchange.id}: could not place sell {pair} after retries"
+            )
+        return order
 
-    def _cancel_order_safe(self, order_id: str, pair: str, max_retries: int = 10) -> None:
+    async def _cancel_order_safe(self, order_id: str, pair: str, max_retries: int = 10) -> None:
         """Cancel an order with retries."""
-        for _ in range(max_retries):
-            try:
-                self.exchange.cancel_order(order_id, pair)
-                return
-            except Exception:
-                time.sleep(0.2)
+        await self._retry(
+            lambda: self.exchange.cancel_order(order_id, pair), max_tries=max_retries
+        )
 
-    def _fetch_order_safe(self, order_id: str, pair: str, max_retries: int = 10) -> dict:
-        """Fetch order info with retries."""
-        for _ in range(max_retries):
-            try:
-                return self.exchange.fetch_order(order_id, pair)
-            except Exception:
-                time.sleep(0.2)
-        return {}
+    async def _fetch_order_safe(self, order_id: str, pair: str, max_retries: int = 10) -> dict:
+        """Return order state from the push-fed cache, REST as fallback.
+
+        Only the event stream writes the cache, so a REST result is never
+        frozen in as stale state on exchanges without the stream.
+        """
+        cached = self._orders_by_id.get(order_id)
+        if cached is not None:
+            return cached
+        order = await self._retry(
+            lambda: self.exchange.fetch_order(order_id, pair), max_tries=max_retries
+        )
+        return order if order is not None else {}
@@ -0,0 +1,29 @@
+"""Atomic top-of-book snapshots shared by the trading loops."""
+
+import time
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class BookTop:
+    """Top-of-book snapshot taken once per loop iteration.
+
+    Every decision in a pass works from these same four prices, so
+    nothing can re-fetch mid-iteration and mix levels from two book
+    states (the crossed-book hazard). The gap branches retarget a side
+    to its second level by rewriting the field, which keeps even that
+    synthetic value tied to this snapshot.
+    """
+
+    best_bid: float
+    second_best_bid: float
+    best_ask: float
+    second_best_ask: float
+    ts: float
+
+
+def book_top(order_book: dict) -> BookTop:
+    """Extract the two top levels of each side into one snapshot."""
+    bids = order_book["bids"]
+    asks = order_book["asks"]
+    return BookTop(bids[0][0], bids[1][0], asks[0][0], asks[1][0], time.time())
@@ -0,0 +1,21 @@
+"""Async exchange client construction shared by the traders."""
+
+import ccxt.async_support
+import ccxt.pro
+
+
+def create_client(name: str, config: dict | None = None) -> ccxt.async_support.Exchange:
+    """Build the async client for an exchange, preferring ccxt.pro.
+
+    Not every exchange has a ccxt.pro implementation (latoken and
+    digifinex do not); those fall back to the plain async REST client.
+    The base traders already branch on `exchange.has` capabilities, so a
+    client without WebSocket streams simply takes the polling paths.
+    """
+    module = ccxt.pro if hasattr(ccxt.pro, name) else ccxt.async_support
+    return getattr(module, name)(config or {})
+
+
+def is_supported(name: str) -> bool:
+    """True when ccxt offers an async client (pro or plain) for `name`."""
+    return hasattr(ccxt.pro, name) or hasattr(ccxt.async_support, name)
@@ -0,0 +1,45 @@
+"""Non-blocking logging for the trading hot paths.
+
+print() is synchronous and holds the GIL while stdout flushes; in the
+order-reaction loops that shows up as real latency. Records are pushed
+onto an in-memory queue instead, and a background listener thread does
+the formatting and I/O off the hot path.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+_log_queue = None
+_listener = None
+
+
+def _start_listener() -> None:
+    global _listener
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    _listener = logging.handlers.QueueListener(_log_queue, handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a logger whose records are emitted by a background thread.
+
+    The first call wires a QueueHandler onto the shared `strategies`
+    root logger and starts the QueueListener that drains it. The
+    listener thread does not survive a fork, so it is restarted in
+    every child process (the pool workers actually running the trades).
+    """
+    global _log_queue
+    if _log_queue is None:
+        _log_queue = queue.SimpleQueue()
+        _start_listener()
+        os.register_at_fork(after_in_child=_start_listener)
+        root = logging.getLogger("strategies")
+        root.addHandler(logging.handlers.QueueHandler(_log_queue))
+        root.setLevel(logging.INFO)
+        root.propagate = False
+    return logging.getLogger(name)
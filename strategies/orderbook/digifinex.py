@@ -1,9 +1,10 @@
 """Digifinex order book spread exploitation trader."""
 
 import os
-import ccxt
+import ccxt.async_support
 from dotenv import load_dotenv
 from strategies.base_orderbook_trader import BaseOrderBookTrader
+from strategies.exchange import create_client
 
 load_dotenv()
 
@@ -11,8 +12,8 @@ load_dotenv()
 class DigifinexOrderBookTrader(BaseOrderBookTrader):
     """Order book trader for Digifinex exchange."""
 
-    def _create_exchange(self) -> ccxt.Exchange:
-        return ccxt.digifinex({
+    def _create_exchange(self) -> ccxt.async_support.Exchange:
+        return create_client("digifinex", {
             "apiKey": os.getenv("DIGIFINEX_API_KEY"),
             "secret": os.getenv("DIGIFINEX_API_SECRET"),
         })
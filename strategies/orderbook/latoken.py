@@ -1,9 +1,10 @@
 """LAToken order book spread exploitation trader."""
 
 import os
-import ccxt
+import ccxt.async_support
 from dotenv import load_dotenv
 from strategies.base_orderbook_trader import BaseOrderBookTrader
+from strategies.exchange import create_client
 
 load_dotenv()
 
@@ -11,8 +12,8 @@ load_dotenv()
 class LatokenOrderBookTrader(BaseOrderBookTrader):
     """Order book trader for LAToken exchange."""
 
-    def _create_exchange(self) -> ccxt.Exchange:
-        return ccxt.latoken({
+    def _create_exchange(self) -> ccxt.async_support.Exchange:
+        return create_client("latoken", {
             "apiKey": os.getenv("LATOKEN_API_KEY"),
             "secret": os.getenv("LATOKEN_API_SECRET"),
         })
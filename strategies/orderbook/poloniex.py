@@ -1,9 +1,10 @@
 """Poloniex order book spread exploitation trader."""
 
 import os
-import ccxt
+import ccxt.async_support
 from dotenv import load_dotenv
 from strategies.base_orderbook_trader import BaseOrderBookTrader
+from strategies.exchange import create_client
 
 load_dotenv()
 
@@ -11,8 +12,10 @@ load_dotenv()
 class PoloniexOrderBookTrader(BaseOrderBookTrader):
     """Order book trader for Poloniex exchange."""
 
-    def _create_exchange(self) -> ccxt.Exchange:
-        exchange = ccxt.poloniex({
+    PREFERRED_REGION = "NRT"  # Poloniex's gateway sits at Cloudflare Tokyo
+
+    def _create_exchange(self) -> ccxt.async_support.Exchange:
+        exchange = create_client("poloniex", {
             "apiKey": os.getenv("POLONIEX_API_KEY"),
             "secret": os.getenv("POLONIEX_API_SECRET"),
         })
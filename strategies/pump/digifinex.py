@@ -1,9 +1,10 @@
 """Digifinex pump anticipation trader."""
 
 import os
-import ccxt
+import ccxt.async_support
 from dotenv import load_dotenv
 from strategies.base_pump_trader import BasePumpTrader
+from strategies.exchange import create_client
 
 load_dotenv()
 
@@ -18,8 +19,8 @@ class DigifinexPumpTrader(BasePumpTrader):
     def _market_buy_uses_cost(self) -> bool:
         return True
 
-    def _create_exchange(self) -> ccxt.Exchange:
-        exchange = ccxt.digifinex({
+    def _create_exchange(self) -> ccxt.async_support.Exchange:
+        exchange = create_client("digifinex", {
             "apiKey": os.getenv("DIGIFINEX_API_KEY"),
             "secret": os.getenv("DIGIFINEX_API_SECRET"),
         })
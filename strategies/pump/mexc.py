@@ -1,9 +1,10 @@
 """MEXC pump anticipation trader."""
 
 import os
-import ccxt
+import ccxt.async_support
 from dotenv import load_dotenv
 from strategies.base_pump_trader import BasePumpTrader
+from strategies.exchange import create_client
 
 load_dotenv()
 
@@ -14,8 +15,8 @@ class MexcPumpTrader(BasePumpTrader):
     Uses amount-based market buy orders (calculates token amount from USD).
     """
 
-    def _create_exchange(self) -> ccxt.Exchange:
-        return ccxt.mexc({
+    def _create_exchange(self) -> ccxt.async_support.Exchange:
+        return create_client("mexc", {
             "apiKey": os.getenv("MEXC_API_KEY"),
             "secret": os.getenv("MEXC_API_SECRET"),
         })
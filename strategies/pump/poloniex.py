@@ -1,9 +1,10 @@
 """Poloniex pump anticipation trader."""
 
 import os
-import ccxt
+import ccxt.async_support
 from dotenv import load_dotenv
 from strategies.base_pump_trader import BasePumpTrader
+from strategies.exchange import create_client
 
 load_dotenv()
 
@@ -14,12 +15,14 @@ class PoloniexPumpTrader(BasePumpTrader):
     Uses cost-based market buy orders (passes USD amount directly).
     """
 
+    PREFERRED_REGION = "NRT"  # Poloniex's gateway sits at Cloudflare Tokyo
+
     @property
     def _market_buy_uses_cost(self) -> bool:
         return True
 
-    def _create_exchange(self) -> ccxt.Exchange:
-        exchange = ccxt.poloniex({
+    def _create_exchange(self) -> ccxt.async_support.Exchange:
+        exchange = create_client("poloniex", {
             "apiKey": os.getenv("POLONIEX_API_KEY"),
             "secret": os.getenv("POLONIEX_API_SECRET"),
         })
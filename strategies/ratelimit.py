@@ -0,0 +1,33 @@
+"""Token-bucket pacing for exchange REST requests."""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Async token bucket shared by every request helper on a client.
+
+    Refills at `qps` tokens per second up to a burst of `qps`; when the
+    bucket runs dry acquire() sleeps exactly long enough for the next
+    token. One shared bucket keeps overlapping retry loops from
+    hammering a rate-limited exchange into a temporary IP ban.
+    """
+
+    def __init__(self, qps: float) -> None:
+        self.qps = max(qps, 0.1)
+        self.tokens = self.qps
+        self.last = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.qps, self.tokens + (now - self.last) * self.qps)
+        self.last = now
+        if self.tokens < 1:
+            wait = (1 - self.tokens) / self.qps
+            self.tokens = 0.0
+            # Advance the refill clock past the sleep so the waited-for
+            # token is not credited a second time on the next acquire.
+            self.last = now + wait
+            await asyncio.sleep(wait)
+        else:
+            self.tokens -= 1.0